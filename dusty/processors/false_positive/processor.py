@@ -19,6 +19,8 @@
     Processor: false_positive
 """
 
+import os
+
 from json import dumps
 from requests import get
 
@@ -71,21 +73,28 @@ class Processor(DependentModuleModel, ProcessorModel):
             fp_config_path = self.galloper_connector()
         else:
             fp_config_path = self.config.get("file", constants.DEFAULT_FP_CONFIG_PATH)
+        if not os.path.exists(fp_config_path):
+            log.warning("False-positive config not found: %s", fp_config_path)
+            return
         try:
             false_positives = dict()
             # Load false positives
             with open(fp_config_path, "r") as file:
-                for line in file.readlines():
-                    if line.strip():
-                        line_data = line.strip()
-                        #
-                        line_hash = line_data
+                for line in file:
+                    line_data = line.strip()
+                    if not line_data:
+                        continue
+                    #
+                    line_hash, separator, line_comment = line_data.partition("#")
+                    if separator:
+                        line_hash = line_hash.strip()
+                        line_comment = line_comment.strip()
+                    else:
                         line_comment = None
-                        if "#" in line_data:
-                            line_hash = line_data.split("#", 1)[0].strip()
-                            line_comment = line_data.split("#", 1)[1].strip()
-                        #
-                        false_positives[line_hash] = line_comment
+                    #
+                    false_positives[line_hash] = line_comment
+            if not false_positives:
+                return
             # Process findings
             for item in self.context.findings:
                 issue_hash = item.get_meta("issue_hash", "<no_hash>")
@@ -27,6 +27,8 @@ from dusty.models.module import DependentModuleModel
 from dusty.models.processor import ProcessorModel
 from dusty.models.finding import DastFinding, SastFinding
 
+_TITLE_CLEANUP = re.compile('[^A-Za-zА-Яа-я0-9//\\\.\- _]+')  # pylint: disable=W1401
+
 
 class Processor(DependentModuleModel, ProcessorModel):
     """ Process findings: inject issue_hash for compatibility during 1.0->2.0 migration """
@@ -45,12 +47,12 @@ class Processor(DependentModuleModel, ProcessorModel):
             issue_hash = None
             # Legacy code: prepare issue hash
             if isinstance(item, DastFinding):
-                title = re.sub('[^A-Za-zА-Яа-я0-9//\\\.\- _]+', '', item.title)  # pylint: disable=W1401
+                title = _TITLE_CLEANUP.sub('', item.title)
                 issue_hash = hashlib.sha256(
                     f'{title}_None_None__'.strip().encode('utf-8')
                 ).hexdigest()
             if isinstance(item, SastFinding):
-                title = re.sub('[^A-Za-zА-Яа-я0-9//\\\.\- _]+', '', item.title)  # pylint: disable=W1401
+                title = _TITLE_CLEANUP.sub('', item.title)
                 cwe = item.get_meta("legacy.cwe", "None")
                 line = item.get_meta("legacy.line", "None")
                 file = item.get_meta("legacy.file", "")
@@ -56,7 +56,7 @@ class Reporter(DependentModuleModel, ReporterModel):
                 continue
             details = ''
             if isinstance(item, DastFinding):
-                details = markdown.markdown_to_html(item.description)
+                details = markdown.cached_markdown_to_html(item.description)
             elif isinstance(item, SastFinding):
                 details = markdown.markdown_to_html("<br/>".join(item.description))
             tags = [item.get_meta("tool", "scanner"), self.context.get_meta("testing_type", "DAST"),
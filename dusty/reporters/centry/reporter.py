@@ -92,7 +92,7 @@ class Reporter(DependentModuleModel, ReporterModel):
                 "excluded_finding": 0 if not item.get_meta("excluded_finding", False) else 1
             }
             if isinstance(item, DastFinding):
-                issue['details'] = markdown.markdown_to_html(item.description)
+                issue['details'] = markdown.cached_markdown_to_html(item.description)
             elif isinstance(item, SastFinding):
                 issue['details'] = markdown.markdown_to_html("\n\n".join(item.description))
             test_cases.append(issue)
@@ -1,20 +1,59 @@
-from requests import post
+import gzip
+
+from requests import Session
 from json import dumps
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 
 from . import constants as c
 
 class IssuesConnector(object):
-    def __init__(self, url, token, project_id):
+    def __init__(self, url, token, project_id, batch_size=None, compress=False,
+                 max_connections=c.MAX_CONNECTIONS):
         self.url = url
         self.token = token
         self.issues_api = c.ISSUES_API.format(project_id)
+        self.batch_size = int(batch_size) if batch_size else None
+        self.compress = compress
+        self.max_connections = max(int(max_connections), 1)
         self.headers = {
             "Content-type": "application/json",
             "Authorization": f"Bearer {token}",
         }
+        if compress:
+            self.headers["Content-Encoding"] = "gzip"
 
     def create_issues(self, findings):
-        result = post(f'{self.url}{self.issues_api}',
-                      data=dumps(findings),
-                      headers=self.headers)
-        return result.content
\ No newline at end of file
+        """ Send issues (in batches if batch_size is set), return list of response contents """
+        with Session() as session:
+            session.headers.update(self.headers)
+            if not self.batch_size:
+                return [self._post_issues(session, list(findings))]
+            return self._post_batches(session, findings)
+
+    def _post_batches(self, session, findings):
+        result = list()
+        pending = list()
+        findings = iter(findings)
+        chunk = list(islice(findings, self.batch_size))
+        if self.max_connections == 1:
+            while chunk:
+                result.append(self._post_issues(session, chunk))
+                chunk = list(islice(findings, self.batch_size))
+            return result
+        with ThreadPoolExecutor(max_workers=self.max_connections) as executor:
+            while chunk:
+                # Keep at most max_connections requests in flight
+                pending.append(executor.submit(self._post_issues, session, chunk))
+                if len(pending) >= self.max_connections:
+                    result.append(pending.pop(0).result())
+                chunk = list(islice(findings, self.batch_size))
+            result.extend(future.result() for future in pending)
+        return result
+
+    def _post_issues(self, session, findings):
+        data = dumps(findings, separators=(",", ":")).encode("utf-8")
+        if self.compress:
+            data = gzip.compress(data)
+        result = session.post(f'{self.url}{self.issues_api}', data=data)
+        return result.content
@@ -20,3 +20,9 @@
 """
 
 ISSUES_API = '/api/v1/issues/findings/{}'
+
+# Workers used to render finding descriptions
+MAX_WORKERS = 8
+
+# Concurrent requests used when issues are sent in batches (parallel sending is opt-in)
+MAX_CONNECTIONS = 1
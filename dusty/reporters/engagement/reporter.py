@@ -21,11 +21,17 @@
 """
 
 import hashlib
+import concurrent.futures
+
 from dusty.tools import markdown, log
 from dusty.models.module import DependentModuleModel
 from dusty.models.reporter import ReporterModel
+from dusty.models.finding import DastFinding
 from dusty.constants import SEVERITIES
-from . import connector
+from . import connector, constants
+
+_CONFIG_KEY = __name__.split(".")[-2]
+_SEVERITY_RANK = {severity: idx for idx, severity in enumerate(SEVERITIES)}
 
 
 class Reporter(DependentModuleModel, ReporterModel):
@@ -37,49 +43,102 @@ class Reporter(DependentModuleModel, ReporterModel):
         self.context = context
         self.test_type = self.context.config['settings']['testing_type']
         self.report_id = context.config['reporters']['centry']['test_id']
-        self.config = \
-            self.context.config["reporters"][__name__.split(".")[-2]]
+        self.config = self.context.config["reporters"][_CONFIG_KEY]
         self.issues_connector = connector.IssuesConnector(
             self.config['url'],
             self.config['token'],
-            self.config['project_id']
+            self.config['project_id'],
+            self.config.get('batch_size', None),
+            self.config.get('compress', False),
+            self.config.get('max_connections', constants.MAX_CONNECTIONS)
         )
 
     def report(self):
         """ Report """
-        issues = []
-        for finding in self.context.findings:
-            title = self.get_title(finding.title)
-            issue = {
-                'issue_id': self.get_hash_code(title),
-                'title': title,
-                "description": self.format_description(finding.description),
-                "severity": finding.get_meta("severity", SEVERITIES[-1]),
-                "project": None,
-                "asset": None,
-                "type": "Vulnerability",
-                "engagement": self.config['engagement_id'],
-                "source_type": "security",
-                "report_id": self.report_id,
-            }
-            issues.append(issue)
+        findings = list(self.context.findings)
+        min_severity = self.config.get("min_severity", None)
+        if min_severity:
+            # Drop findings below threshold before descriptions are rendered
+            # Unknown finding severities are ranked as the lowest one
+            threshold = _SEVERITY_RANK[min_severity]
+            findings = [
+                finding for finding in findings
+                if _SEVERITY_RANK.get(
+                    finding.get_meta("severity", SEVERITIES[-1]), len(SEVERITIES) - 1
+                ) <= threshold
+            ]
+        if not findings:
+            log.info("No findings to report")
+            return
+        issues = self.build_issues(findings)
         self.issues_connector.create_issues(issues)
 
+    def build_issues(self, findings):
+        """ Make issue payloads for findings (yields issues one by one) """
+        engagement_id = self.config['engagement_id']
+        default_severity = SEVERITIES[-1]
+        target = self.get_target()
+        template = {
+            'issue_id': None,
+            'title': None,
+            "description": None,
+            "severity": None,
+            "project": None,
+            "asset": None,
+            "type": "Vulnerability",
+            "engagement": engagement_id,
+            "source_type": "security",
+            "report_id": self.report_id,
+        }
+        get_hash_code = self.get_hash_code
+        # Render descriptions batch by batch (same size as sent by connector),
+        # so rendered HTML of a batch is released once it is posted
+        batch_size = self.issues_connector.batch_size or len(findings)
+        # SAST/DEPENDENCY descriptions are sent as is, only markdown needs worker threads
+        executor = None
+        render = map
+        if self.test_type not in ("SAST", "DEPENDENCY"):
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=int(self.config.get("max_workers", constants.MAX_WORKERS))
+            )
+            render = executor.map
+        try:
+            for start in range(0, len(findings), batch_size):
+                batch = findings[start:start + batch_size]
+                descriptions = render(self.format_description, batch)
+                for finding, description in zip(batch, descriptions):
+                    title = self.get_title(finding.title, target)
+                    issue = template.copy()
+                    issue['issue_id'] = get_hash_code(title)
+                    issue['title'] = title
+                    issue["description"] = description
+                    issue["severity"] = finding.meta.get("severity", default_severity)
+                    yield issue
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
     def get_hash_code(self, title):
         return hashlib.sha256(title.strip().encode('utf-8')).hexdigest()
 
-    def get_title(self, title):
-        return f"{title}. {self.test_type} SCAN: {self.get_target()}"
+    def get_title(self, title, target=None):
+        if target is None:
+            target = self.get_target()
+        return f"{title}. {self.test_type} SCAN: {target}"
     
     def get_target(self):
         if self.test_type in ("SAST", "DEPENDENCY"):
             return self.context.config.get('actions', {}).get('git_clone', {}).get('source')
         return list(self.context.config['scanners']['dast'].values())[0]['target']
     
-    def format_description(self, description):
+    def format_description(self, finding):
         if self.test_type in ('SAST', "DEPENDENCY"):
-            return description
-        return markdown.markdown_to_html(description)
+            return finding.description
+        if not finding.description:
+            return ""
+        if isinstance(finding, DastFinding):
+            return markdown.cached_markdown_to_html(finding.description)
+        return markdown.markdown_to_html(finding.description)
     
     @staticmethod
     def fill_config(data_obj):
@@ -88,7 +147,20 @@ class Reporter(DependentModuleModel, ReporterModel):
         data_obj.insert(len(data_obj), "project_id", "1", comment="ID of project to report to")
         data_obj.insert(len(data_obj), "token", "", comment="Token for authentication")
         data_obj.insert(len(data_obj), "engagement_id", "", comment="Engagement id under which tests being executed")
+        data_obj.insert(len(data_obj), "batch_size", 100, comment="(optional) Number of issues sent per request")
+        data_obj.insert(len(data_obj), "max_workers", constants.MAX_WORKERS, comment="(optional) Threads used to render descriptions")
+        data_obj.insert(len(data_obj), "compress", False, comment="(optional) Send gzip-compressed payloads")
+        data_obj.insert(len(data_obj), "max_connections", constants.MAX_CONNECTIONS, comment="(optional) Concurrent requests when sending batches (1 - sequential)")
+        data_obj.insert(len(data_obj), "min_severity", "Info", comment="(optional) Minimal severity level to report, one of: Critical, High, Medium, Low, Info")
 
+    @staticmethod
+    def validate_config(config):
+        """ Validate config """
+        min_severity = config.get("min_severity", None)
+        if min_severity and min_severity not in SEVERITIES:
+            error = f"Invalid min_severity: {min_severity}, expected one of: {', '.join(SEVERITIES)}"
+            log.error(error)
+            raise ValueError(error)
 
     @staticmethod
     def get_name():
@@ -41,7 +41,7 @@ class HTMLPresenter:
                 tool=item.get_meta("tool", ""),
                 title=item.title,
                 severity=item.get_meta("severity", SEVERITIES[-1]),
-                description=markdown.markdown_to_html(item.description)
+                description=markdown.cached_markdown_to_html(item.description)
             )
         if isinstance(item, SastFinding):
             return HTMLReportFinding(
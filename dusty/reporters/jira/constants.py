@@ -39,13 +39,23 @@ JIRA_ALTERNATIVES = {
     'Critical': ['Very High', 'Blocker'],
     'Blocker': ['Very High', 'Highest', 'Critical']
 }
-JIRA_OPENED_STATUSES = ['Open', 'In Progress']
+JIRA_OPENED_STATUSES = frozenset(['Open', 'In Progress'])
 JIRA_DESCRIPTION_MAX_SIZE = 61908
 # This is jira.text.field.character.limit default value
 JIRA_COMMENT_MAX_SIZE = 32767
 
 JIRA_DESCRIPTION_CUT = " ... [cont. in comment]"
 
+# Max number of comments added in one issue update request
+JIRA_COMMENTS_PER_UPDATE = 10
+
+# Ticket creation time formats
+JIRA_CREATED_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+JIRA_OPEN_DATE_FORMAT = "%d %b %Y %H:%M"
+
+# Number of tickets submitted concurrently (parallel submission is opt-in)
+JIRA_CONCURRENCY = 1
+
 # Priority/Severity mapping
 JIRA_SEVERITY_MAPPING = {
     "Critical": "Critical",
@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+# coding=utf-8
+
+#   Copyright 2019 getcarrier.io
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""
+    Jira helper
+"""
+
+import re
+
+from datetime import datetime
+
+from dusty.tools import log
+
+from . import constants
+
+_NUMERIC_BACKREF = re.compile(r"\\[1-9]|\(\?\(\d")
+_HTML_TO_JIRA = re.compile(r"\\\.|<pre>|</pre>|<br />")
+_HTML_TO_JIRA_TABLE = {
+    "\\.": ".",
+    "<pre>": "{code:collapse=true}\n\n",
+    "</pre>": "\n\n{code}",
+    "<br />": "\n",
+}
+
+
+def combine_dynamic_patterns(patterns):
+    """
+        Combine list of (pattern, value) into single regex
+
+        Every pattern is placed into optional lookahead with own named group,
+        so one match() call reports all patterns matching at string start.
+        Returns None if patterns can not be combined (global flags, numeric
+        backreferences or duplicate group names)
+    """
+    if not patterns:
+        return None
+    for pattern, _ in patterns:
+        if pattern.flags & ~re.UNICODE or _NUMERIC_BACKREF.search(pattern.pattern):
+            return None
+    try:
+        return re.compile("".join(
+            f"(?:(?=(?P<_dynamic_{idx}>{pattern.pattern})))?"
+            for idx, (pattern, _) in enumerate(patterns)
+        ))
+    except re.error:
+        log.debug("Failed to combine dynamic patterns, using separate matching")
+        return None
+
+
+def match_dynamic_patterns(combined, patterns, value):
+    """ Get values for all patterns matching given string (in patterns order) """
+    if combined is None:
+        return [item for pattern, item in patterns if pattern.match(value)]
+    match = combined.match(value)
+    return [
+        item for idx, (_, item) in enumerate(patterns)
+        if match.group(f"_dynamic_{idx}") is not None
+    ]
+
+
+def html_to_jira(text):
+    """ Convert SAST description chunk markup to Jira markup (in one pass) """
+    return _HTML_TO_JIRA.sub(lambda item: _HTML_TO_JIRA_TABLE[item.group()], text)
+
+
+def parse_jira_datetime(value):
+    """ Parse Jira timestamp (e.g. 2019-01-01T10:00:00.000+0000) """
+    # Python < 3.11 fromisoformat accepts "+00:00" offsets only (not "Z" or "+0000")
+    if value.endswith("Z"):
+        value = f"{value[:-1]}+00:00"
+    elif len(value) > 5 and value[-5] in "+-" and value[-4:].isdigit():
+        value = f"{value[:-2]}:{value[-2:]}"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:  # Other (non ISO) formats
+        return datetime.strptime(value, constants.JIRA_CREATED_FORMAT)
+
+
+class FindingRecord:  # pylint: disable=R0902,R0903
+    """ Jira ticket data prepared from finding """
+
+    __slots__ = (
+        "title", "priority", "description", "issue_hash", "additional_labels",
+        "dynamic_fields", "comments", "raw", "wrapper", "sort_key",
+    )
+
+    def __init__(  # pylint: disable=R0913
+            self, title, priority, description, issue_hash, additional_labels,
+            dynamic_fields, raw, wrapper, sort_key, comments=None
+    ):
+        self.title = title
+        self.priority = priority
+        self.description = description
+        self.issue_hash = issue_hash
+        self.additional_labels = additional_labels
+        self.dynamic_fields = dynamic_fields
+        self.comments = comments if comments is not None else list()
+        self.raw = raw
+        self.wrapper = wrapper
+        self.sort_key = sort_key
@@ -24,7 +24,7 @@ import os
 from dusty.tools import log as logging # import logging
 from dusty.tools.dict import recursive_merge
 from copy import deepcopy
-from jira import JIRA
+from jira import JIRA, JIRAError
 from traceback import format_exc
 from . import constants as const # from dusty import constants as const
 
@@ -217,6 +217,23 @@ class JiraWrapper(object):
     def add_comment_to_issue(self, issue, data):
         return self.client.add_comment(issue, data)
 
+    def add_comments_to_issue(self, issue, comments):
+        # Issue update requests with bounded number of comments instead of one request per comment
+        step = const.JIRA_COMMENTS_PER_UPDATE
+        for start in range(0, len(comments), step):
+            group = comments[start:start + step]
+            try:
+                issue.update(update={"comment": [{"add": {"body": item}} for item in group]})
+            except JIRAError as error:
+                # Only rejected update (e.g. comment is not on edit screen) is safe to retry,
+                # other errors may come after comments were already added (e.g. on issue reload)
+                if error.status_code != 400:
+                    raise
+                logging.warning(f"Failed to add comments to {issue.key} in bulk, adding one by one")
+                for item in comments[start:]:
+                    self.add_comment_to_issue(issue, item)
+                return
+
     def get_created_tickets(self):
         return self.created_jira_tickets
 
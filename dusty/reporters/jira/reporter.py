@@ -21,9 +21,10 @@
 """
 
 import re
+import operator
+import functools
 import traceback
-
-from datetime import datetime
+import concurrent.futures
 
 from ruamel.yaml.comments import CommentedSeq
 from ruamel.yaml.comments import CommentedMap
@@ -38,6 +39,39 @@ from dusty.constants import SEVERITIES
 
 from . import constants
 from .legacy import JiraWrapper, prepare_jira_mapping, cut_jira_comment
+from .helper import combine_dynamic_patterns, match_dynamic_patterns, html_to_jira
+from .helper import parse_jira_datetime, FindingRecord
+
+_SEVERITY_RANK = {severity: idx for idx, severity in enumerate(SEVERITIES)}
+_SKIP_META_KEYS = ("information_finding", "false_positive_finding", "excluded_finding")
+_SAMPLE_FIELDS = (
+    ("Issue Type", "Bug", "(field) Ticket type"),
+    ("Assignee", "Ticket_Assignee", "(field) Assignee"),
+    ("Epic Link", "SOMEPROJECT-1234", "(field) Epic"),
+    ("Security Level", "SOME_LEVEL", "(field) Security level"),
+)
+_SAMPLE_PRIORITY_MAPPING = (
+    ("Critical", "Very High"),
+    ("Major", "High"),
+    ("Medium", "Medium"),
+    ("Minor", "Low"),
+    ("Trivial", "Low"),
+)
+
+
+def _is_skipped(item):
+    """ Check if finding is marked as information, false positive or excluded """
+    meta = item.meta
+    for key in _SKIP_META_KEYS:
+        if meta.get(key, False):
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def _sanitize_labels(tool, testing_type, severity):
+    """ Make Jira labels (tuple) from finding tool, testing type and severity """
+    return tuple(label.replace(" ", "_") for label in (tool, testing_type, severity))
 
 
 class Reporter(DependentModuleModel, ReporterModel):
@@ -51,6 +85,19 @@ class Reporter(DependentModuleModel, ReporterModel):
             self.context.config["reporters"][__name__.split(".")[-2]]
         #
         self.set_meta("config", self.config)
+        # Compile dynamic mapping patterns once per reporter instance
+        self._dynamic_jira_patterns = [
+            (re.compile(key), value)
+            for key, value in (self.config.get("dynamic_jira", None) or dict()).items()
+        ]
+        self._dynamic_label_patterns = self._compile_dynamic_patterns(
+            self.config.get("dynamic_labels", None), "label"
+        )
+        self._dynamic_field_patterns = self._compile_dynamic_patterns(
+            self.config.get("dynamic_fields", None), "field"
+        )
+        self._dynamic_label_regex = combine_dynamic_patterns(self._dynamic_label_patterns)
+        self._dynamic_field_regex = combine_dynamic_patterns(self._dynamic_field_patterns)
 
     def report(self):
         """ Report """
@@ -65,8 +112,8 @@ class Reporter(DependentModuleModel, ReporterModel):
         """ Report """
         wrappers_config = dict()
         wrappers_config[None] = self.config
-        for key, value in self.config.get("dynamic_jira").items():
-            wrappers_config[re.compile(key)] = value
+        for pattern, value in self._dynamic_jira_patterns:
+            wrappers_config[pattern] = value
         #
         wrappers = dict()
         for wrapper_key, wrapper_config in wrappers_config.items():
@@ -87,302 +134,49 @@ class Reporter(DependentModuleModel, ReporterModel):
                 log.error("Jira configuration is invalid. Skipping Jira reporting")
                 raise RuntimeError("Jira configuration is invalid")
             #
-            wrappers[wrapper_key] = dict()
-            wrappers[wrapper_key]["wrapper"] = wrapper
-            wrappers[wrapper_key]["config"] = wrapper_config
+            wrapper_data = dict()
+            wrapper_data["wrapper"] = wrapper
+            wrapper_data["config"] = wrapper_config
             #
-            if wrapper_config.get("separate_epic_linkage", False) and \
-                    "Epic Link" in wrapper_config.get("fields"):
-                wrappers[wrapper_key]["epic_link"] = wrapper_config.get("fields").pop("Epic Link")
+            fields = wrapper_config.get("fields")
+            separate_epic_linkage = wrapper_config.get("separate_epic_linkage", False)
+            if separate_epic_linkage and "Epic Link" in fields:
+                wrapper_data["epic_link"] = fields.pop("Epic Link")
             #
-            wrappers[wrapper_key]["raw_epic_link"] = None
-            if wrapper_config.get("separate_epic_linkage", False):
-                wrappers[wrapper_key]["raw_epic_link"] = wrappers[wrapper_key]["epic_link"]
-            elif "Epic Link" in wrapper_config.get("fields"):
-                wrappers[wrapper_key]["raw_epic_link"] = wrapper_config.get("fields")["Epic Link"]
+            wrapper_data["raw_epic_link"] = None
+            if separate_epic_linkage:
+                wrapper_data["raw_epic_link"] = wrapper_data["epic_link"]
+            elif "Epic Link" in fields:
+                wrapper_data["raw_epic_link"] = fields["Epic Link"]
             #
-            wrappers[wrapper_key]["priority_mapping"] = wrapper_config.get(
-                "custom_mapping", prepare_jira_mapping(wrapper)
-            )
-            wrappers[wrapper_key]["mapping_meta"] = dict(wrappers[wrapper_key]["priority_mapping"])
+            wrapper_data["priority_mapping"] = self._get_priority_mapping(wrapper_config, wrapper)
+            wrapper_data["mapping_meta"] = dict(wrapper_data["priority_mapping"])
+            wrapper_data["max_description_size"] = \
+                self._get_max_description_size(wrapper_config)
             #
+            wrappers[wrapper_key] = wrapper_data
         self.set_meta("wrapper", wrappers[None]["wrapper"])
         self.set_meta("raw_epic_link", wrappers[None]["raw_epic_link"])
         #
-        dynamic_label_mapping = dict()
-        if self.config.get("dynamic_labels", None):
-            try:
-                for key, value in self.config.get("dynamic_labels").items():
-                    dynamic_label_mapping[re.compile(key)] = value
-            except:  # pylint: disable=W0702
-                log.exception("Failed to add dynamic label mapping")
-        #
-        dynamic_field_mapping = dict()
-        if self.config.get("dynamic_fields", None):
-            try:
-                for key, value in self.config.get("dynamic_fields").items():
-                    dynamic_field_mapping[re.compile(key)] = value
-            except:  # pylint: disable=W0702
-                log.exception("Failed to add dynamic field mapping")
-        #
-        findings = list()
-        for item in self.context.findings:  # pylint: disable=R1702
-            #
-            if item.get_meta("information_finding", False) or \
-                    item.get_meta("false_positive_finding", False) or \
-                    item.get_meta("excluded_finding", False):
-                continue
-            #
-            if isinstance(item, (DastFinding, SastFinding)):
-                #
-                dynamic_labels = list()
-                dynamic_fields = list()
-                dynamic_wrapper = wrappers[None]
-                #
-                for endpoint in item.get_meta("endpoints", list()):
-                    #
-                    for pattern, addon_label in dynamic_label_mapping.items():
-                        try:
-                            if pattern.match(endpoint.raw):
-                                dynamic_labels.append(addon_label)
-                        except:  # pylint: disable=W0702
-                            log.exception("Failed to add dynamic label")
-                    #
-                    for pattern, addon_fields in dynamic_field_mapping.items():
-                        try:
-                            if pattern.match(endpoint.raw):
-                                dynamic_fields.append(addon_fields)
-                        except:  # pylint: disable=W0702
-                            log.exception("Failed to add dynamic field")
-                    #
-                    for pattern, addon_jira in wrappers.items():
-                        if pattern is None:
-                            continue
-                        try:
-                            if pattern.match(endpoint.raw):
-                                dynamic_wrapper = addon_jira
-                        except:  # pylint: disable=W0702
-                            log.exception("Failed to add dynamic JIRA")
-                #
-                severity = item.get_meta("severity", SEVERITIES[-1])
-                priority = constants.JIRA_SEVERITY_MAPPING[severity]
-                if dynamic_wrapper["priority_mapping"] and \
-                        priority in dynamic_wrapper["priority_mapping"]:
-                    priority = dynamic_wrapper["priority_mapping"][priority]
-                dynamic_wrapper["mapping_meta"][severity] = priority
-                #
-                if isinstance(item, DastFinding):
-                    findings.append({
-                        "title": item.title,
-                        "priority": priority,
-                        "description": item.description.replace("\\.", "."),
-                        "issue_hash": item.get_meta("issue_hash", "<no_hash>"),
-                        "additional_labels": [
-                            label.replace(" ", "_") for label in [
-                                item.get_meta("tool", "scanner"),
-                                self.context.get_meta("testing_type", "DAST"),
-                                item.get_meta("severity", SEVERITIES[-1])
-                            ]
-                        ] + dynamic_labels,
-                        "dynamic_fields": dynamic_fields,
-                        "raw": item,
-                        "wrapper": dynamic_wrapper,
-                    })
-                elif isinstance(item, SastFinding):
-                    #
-                    description_chunks = [
-                        item.replace(
-                            "\\.", "."
-                        ).replace(
-                            "<pre>", "{code:collapse=true}\n\n"
-                        ).replace(
-                            "</pre>", "\n\n{code}"
-                        ).replace(
-                            "<br />", "\n"
-                        ) for item in item.description
-                    ]
-                    #
-                    if len("\n\n".join(description_chunks)) > constants.JIRA_DESCRIPTION_MAX_SIZE:
-                        description = description_chunks[0]
-                        chunks = description_chunks[1:]
-                        comments = list()
-                        new_line_str = '  \n  \n'
-                        for chunk in chunks:
-                            if not comments or (
-                                    len(comments[-1]) + len(new_line_str) + len(chunk)
-                                ) >= \
-                                    constants.JIRA_COMMENT_MAX_SIZE:
-                                comments.append(cut_jira_comment(chunk))
-                            else:  # Last comment can handle one more chunk
-                                comments[-1] += new_line_str + cut_jira_comment(chunk)
-                    else:
-                        description = "\n\n".join(description_chunks)
-                        comments = list()
-                    #
-                    findings.append({
-                        "title": item.title,
-                        "priority": priority,
-                        "description": description,
-                        "issue_hash": item.get_meta("issue_hash", "<no_hash>"),
-                        "additional_labels": [
-                            label.replace(" ", "_") for label in [
-                                item.get_meta("tool", "scanner"),
-                                self.context.get_meta("testing_type", "SAST"),
-                                item.get_meta("severity", SEVERITIES[-1])
-                            ]
-                        ] + dynamic_labels,
-                        "dynamic_fields": dynamic_fields,
-                        "comments": comments,
-                        "raw": item,
-                        "wrapper": dynamic_wrapper,
-                    })
-                #
-            #
-            else:
-                log.warning("Unsupported finding type")
-                continue # raise ValueError("Unsupported item type")
-        #
+        findings = self._build_findings(wrappers)
         self.set_meta("mapping", wrappers[None]["mapping_meta"])
-        #
-        for finding in findings:
-            if finding["wrapper"]["config"].get("max_description_size", False):
-                if len(finding["description"]) > \
-                        int(finding["wrapper"]["config"].get("max_description_size")):
-                    if "comments" not in finding:
-                        finding["comments"] = list()
-                    #
-                    comment_chunks = list()
-                    cut_line_len = len(constants.JIRA_DESCRIPTION_CUT)
-                    cut_point = int(
-                        finding["wrapper"]["config"].get("max_description_size")
-                    ) - cut_line_len
-                    #
-                    item_description = finding["description"]
-                    finding["description"] = \
-                        f"{item_description[:cut_point]}{constants.JIRA_DESCRIPTION_CUT}"
-                    #
-                    description_data = item_description[cut_point:]
-                    comment_cut_threshold = min(
-                        constants.JIRA_COMMENT_MAX_SIZE,
-                        int(finding["wrapper"]["config"].get("max_description_size"))
-                    )
-                    cut_point = comment_cut_threshold - cut_line_len
-                    #
-                    while description_data:
-                        if len(description_data) > comment_cut_threshold:
-                            comment_chunks.append(
-                                f"{description_data[:cut_point]}{constants.JIRA_DESCRIPTION_CUT}"
-                            )
-                            description_data = description_data[cut_point:]
-                        else:
-                            comment_chunks.append(description_data)
-                            break
-                    #
-                    while comment_chunks:
-                        finding["comments"].insert(0, comment_chunks.pop())
-        #
-        findings.sort(key=lambda item: (
-            SEVERITIES.index(item["raw"].get_meta("severity", SEVERITIES[-1])),
-            item["raw"].get_meta("tool", ""),
-            item["raw"].title
-        ))
-        #
-        new_tickets = list()
-        existing_tickets = list()
-        #
-        for _, local_wrapper in wrappers.items():
-            local_wrapper["wrapper"].connect()
-        #
-        for finding in findings:
-            try:
-                config_labels = finding["wrapper"]["config"].get("additional_labels", None)
-                if config_labels is None:
-                    config_labels = list()
-                if not isinstance(config_labels, list):
-                    config_labels = [item.strip() for item in config_labels.split(",")]
-                #
-                field_overrides = dict()
-                for dynamic_field in finding["dynamic_fields"]:
-                    field_overrides.update(dynamic_field)
-                #
-                issue, created = finding["wrapper"]["wrapper"].create_issue(
-                    finding["title"], # title
-                    finding["priority"], # priority
-                    finding["description"], # description
-                    finding["issue_hash"], # issue_hash, self.get_hash_code()
-                    # attachments=None,
-                    # get_or_create=True,
-                    additional_labels=finding["additional_labels"]+config_labels, # additional_labels  # pylint: disable=C0301
-                    field_overrides=field_overrides,
-                )
-                if created and "comments" in finding:
-                    for comment in finding["comments"]:
-                        finding["wrapper"]["wrapper"].add_comment_to_issue(issue, comment)
-                if created and finding["wrapper"]["config"].get("separate_epic_linkage", False):
-                    try:
-                        finding["wrapper"]["wrapper"].client.add_issues_to_epic(
-                            finding["wrapper"]["epic_link"], [str(issue.key)]
-                        )
-                    except:  # pylint: disable=W0702
-                        log.exception(
-                            "Failed to add ticket %s to epic %s", str(issue.key),
-                            finding["wrapper"]["epic_link"]
-                        )
-                try:
-                    result_priority = str(issue.fields.priority)
-                except:  # pylint: disable=W0702
-                    result_priority = "Default"
-                #
-                ticket_meta = {
-                    "jira_id": issue.key,
-                    "jira_url": f"{finding['wrapper']['config'].get('url')}/browse/{issue.key}",  # pylint: disable=C0301
-                    "priority": result_priority,
-                    "status": issue.fields.status.name,
-                    "created": issue.fields.created,
-                    "open_date": datetime.strptime(
-                        issue.fields.created, "%Y-%m-%dT%H:%M:%S.%f%z").strftime("%d %b %Y %H:%M"),
-                    "description": issue.fields.summary,
-                    "assignee": str(issue.fields.assignee),
-                    "raw_created": str(issue.fields.created),
-                    "raw_severity": finding["raw"].get_meta("severity", SEVERITIES[-1]),
-                    "raw_jira_url": finding["wrapper"]["config"].get("url"),
-                    "raw_jira_project": finding["wrapper"]["config"].get("project"),
-                    "raw_jira_epic": finding["wrapper"]["raw_epic_link"],
-                    "raw_jira_fields": finding["wrapper"]["config"].get("fields"),
-                    "raw_addon_fields": field_overrides,
-                    "raw_addon_labels": finding["additional_labels"]+config_labels,
-                }
-                if created:
-                    if not self._ticket_in_list(ticket_meta, new_tickets):
-                        new_tickets.append(ticket_meta)
-                else:
-                    if issue.fields.status.name in constants.JIRA_OPENED_STATUSES:
-                        if not self._ticket_in_list(ticket_meta, existing_tickets):
-                            existing_tickets.append(ticket_meta)
-            except:  # pylint: disable=W0702
-                log.exception(f"Failed to create ticket for {finding['title']}")
-                error = Error(
-                    tool=self.get_name(),
-                    error=f"Failed to create ticket for {finding['title']}",
-                    details=f"```\n{traceback.format_exc()}\n```"
-                )
-                self.errors.append(error)
-        #
-        self.set_meta("new_tickets", new_tickets)
-        self.set_meta("existing_tickets", existing_tickets)
+        self._apply_size_limits(findings)
+        self._submit(findings, wrappers)
 
     def report_normal(self):
         """ Report """
+        fields = self.config.get("fields")
+        separate_epic_linkage = self.config.get("separate_epic_linkage", False)
         # Remove "Epic Link" from fields if requested
-        if self.config.get("separate_epic_linkage", False) and \
-                "Epic Link" in self.config.get("fields"):
-            epic_link = self.config.get("fields").pop("Epic Link")
+        epic_link = None
+        if separate_epic_linkage and "Epic Link" in fields:
+            epic_link = fields.pop("Epic Link")
         # Save raw Epic Link
         raw_epic_link = None
-        if self.config.get("separate_epic_linkage", False):
+        if separate_epic_linkage:
             raw_epic_link = epic_link
-        elif "Epic Link" in self.config.get("fields"):
-            raw_epic_link = self.config.get("fields")["Epic Link"]
+        elif "Epic Link" in fields:
+            raw_epic_link = fields["Epic Link"]
         self.set_meta("raw_epic_link", raw_epic_link)
         # Prepare wrapper
         log.info("Creating legacy wrapper instance")
@@ -391,7 +185,7 @@ class Reporter(DependentModuleModel, ReporterModel):
             self.config.get("username"),
             self.config.get("password"),
             self.config.get("project"),
-            self.config.get("fields")
+            fields
         )
         if not wrapper.valid:
             # Save default mapping to meta as a fallback
@@ -403,271 +197,355 @@ class Reporter(DependentModuleModel, ReporterModel):
             raise RuntimeError("Jira configuration is invalid")
         log.debug("Legacy wrapper is valid")
         self.set_meta("wrapper", wrapper)
-        # Prepare dynamic label mapping
-        dynamic_label_mapping = dict()
-        if self.config.get("dynamic_labels", None):
-            try:
-                for key, value in self.config.get("dynamic_labels").items():
-                    dynamic_label_mapping[re.compile(key)] = value
-            except:  # pylint: disable=W0702
-                log.exception("Failed to add dynamic label mapping")
-        # Prepare dynamic fields mapping
-        dynamic_field_mapping = dict()
-        if self.config.get("dynamic_fields", None):
-            try:
-                for key, value in self.config.get("dynamic_fields").items():
-                    dynamic_field_mapping[re.compile(key)] = value
-            except:  # pylint: disable=W0702
-                log.exception("Failed to add dynamic field mapping")
-        # Prepare findings
-        priority_mapping = self.config.get("custom_mapping", prepare_jira_mapping(wrapper))
-        mapping_meta = dict(priority_mapping)
+        priority_mapping = self._get_priority_mapping(self.config, wrapper)
+        wrappers = {
+            None: {
+                "wrapper": wrapper,
+                "config": self.config,
+                "epic_link": epic_link,
+                "raw_epic_link": raw_epic_link,
+                "priority_mapping": priority_mapping,
+                "mapping_meta": dict(priority_mapping),
+                "max_description_size": self._get_max_description_size(self.config),
+            }
+        }
+        # Prepare and submit findings
+        findings = self._build_findings(wrappers)
+        self._apply_size_limits(findings)
+        self._submit(findings, wrappers)
+        self.set_meta("mapping", wrappers[None]["mapping_meta"])
+
+    def _build_findings(self, wrappers):  # pylint: disable=R0914
+        """ Make sorted Jira ticket data list from context findings """
+        dynamic_label_mapping = self._dynamic_label_patterns
+        dynamic_label_regex = self._dynamic_label_regex
+        dynamic_field_mapping = self._dynamic_field_patterns
+        dynamic_field_regex = self._dynamic_field_regex
+        #
+        dynamic_jira_mapping = [
+            (pattern, wrapper) for pattern, wrapper in wrappers.items() if pattern is not None
+        ]
+        dynamic_jira_regex = combine_dynamic_patterns(dynamic_jira_mapping)
+        # Skip endpoint matching completely when no dynamic mapping is set
+        match_endpoints = bool(
+            dynamic_label_mapping or dynamic_field_mapping or dynamic_jira_mapping
+        )
+        #
         findings = list()
-        for item in self.context.findings:  # pylint: disable=R1702
-            if item.get_meta("information_finding", False) or \
-                    item.get_meta("false_positive_finding", False) or \
-                    item.get_meta("excluded_finding", False):
+        for item in self.context.findings:
+            if _is_skipped(item):
                 continue
             #
-            if isinstance(item, DastFinding):
-                severity = item.get_meta("severity", SEVERITIES[-1])
-                priority = constants.JIRA_SEVERITY_MAPPING[severity]
-                if priority_mapping and priority in priority_mapping:
-                    priority = priority_mapping[priority]
-                mapping_meta[severity] = priority  # Update meta mapping to reflect actual results
-                #
-                dynamic_labels = list()
-                dynamic_fields = list()
-                #
-                for endpoint in item.get_meta("endpoints", list()):
-                    #
-                    for pattern, addon_label in dynamic_label_mapping.items():
-                        try:
-                            if pattern.match(endpoint.raw):
-                                dynamic_labels.append(addon_label)
-                        except:  # pylint: disable=W0702
-                            log.exception("Failed to add dynamic label")
-                    #
-                    for pattern, addon_fields in dynamic_field_mapping.items():
-                        try:
-                            if pattern.match(endpoint.raw):
-                                dynamic_fields.append(addon_fields)
-                        except:  # pylint: disable=W0702
-                            log.exception("Failed to add dynamic field")
-                #
-                findings.append({
-                    "title": item.title,
-                    "priority": priority,
-                    "description": item.description.replace("\\.", "."),
-                    "issue_hash": item.get_meta("issue_hash", "<no_hash>"),
-                    "additional_labels": [
-                        label.replace(" ", "_") for label in [
-                            item.get_meta("tool", "scanner"),
-                            self.context.get_meta("testing_type", "DAST"),
-                            item.get_meta("severity", SEVERITIES[-1])
-                        ]
-                    ] + dynamic_labels,
-                    "dynamic_fields": dynamic_fields,
-                    "raw": item
-                })
+            if not isinstance(item, (DastFinding, SastFinding)):
+                log.warning("Unsupported finding type")
+                continue # raise ValueError("Unsupported item type")
             #
-            elif isinstance(item, SastFinding):
-                severity = item.get_meta("severity", SEVERITIES[-1])
-                priority = constants.JIRA_SEVERITY_MAPPING[severity]
-                if priority_mapping and priority in priority_mapping:
-                    priority = priority_mapping[priority]
-                mapping_meta[severity] = priority  # Update meta mapping to reflect actual results
-                description_chunks = [
-                    item.replace(
-                        "\\.", "."
-                    ).replace(
-                        "<pre>", "{code:collapse=true}\n\n"
-                    ).replace(
-                        "</pre>", "\n\n{code}"
-                    ).replace(
-                        "<br />", "\n"
-                    ) for item in item.description
-                ]
-                if len("\n\n".join(description_chunks)) > constants.JIRA_DESCRIPTION_MAX_SIZE:
-                    description = description_chunks[0]
-                    chunks = description_chunks[1:]
-                    comments = list()
-                    new_line_str = '  \n  \n'
-                    for chunk in chunks:
-                        if not comments or (len(comments[-1]) + len(new_line_str) + len(chunk)) >= \
-                                constants.JIRA_COMMENT_MAX_SIZE:
-                            comments.append(cut_jira_comment(chunk))
-                        else:  # Last comment can handle one more chunk
-                            comments[-1] += new_line_str + cut_jira_comment(chunk)
-                else:
-                    description = "\n\n".join(description_chunks)
-                    comments = list()
-                #
-                dynamic_labels = list()
-                dynamic_fields = list()
-                #
-                for endpoint in item.get_meta("endpoints", list()):
-                    #
-                    for pattern, addon_label in dynamic_label_mapping.items():
-                        try:
-                            if pattern.match(endpoint.raw):
-                                dynamic_labels.append(addon_label)
-                        except:  # pylint: disable=W0702
-                            log.exception("Failed to add dynamic label")
-                    #
-                    for pattern, addon_fields in dynamic_field_mapping.items():
-                        try:
-                            if pattern.match(endpoint.raw):
-                                dynamic_fields.append(addon_fields)
-                        except:  # pylint: disable=W0702
-                            log.exception("Failed to add dynamic field")
+            dynamic_labels = list()
+            dynamic_fields = list()
+            dynamic_wrapper = wrappers[None]
+            #
+            endpoints = item.get_meta("endpoints", list()) if match_endpoints else list()
+            for endpoint in endpoints:
+                # Patterns can only fail on non-string input, so check it once
+                raw = endpoint.raw
+                if not isinstance(raw, str):
+                    log.warning("Skipping dynamic mapping for non-string endpoint: %s", raw)
+                    continue
                 #
-                findings.append({
-                    "title": item.title,
-                    "priority": priority,
-                    "description": description,
-                    "issue_hash": item.get_meta("issue_hash", "<no_hash>"),
-                    "additional_labels": [
-                        label.replace(" ", "_") for label in [
-                            item.get_meta("tool", "scanner"),
-                            self.context.get_meta("testing_type", "SAST"),
-                            item.get_meta("severity", SEVERITIES[-1])
-                        ]
-                    ] + dynamic_labels,
-                    "dynamic_fields": dynamic_fields,
-                    "comments": comments,
-                    "raw": item
-                })
+                dynamic_labels.extend(match_dynamic_patterns(
+                    dynamic_label_regex, dynamic_label_mapping, raw
+                ))
+                dynamic_fields.extend(match_dynamic_patterns(
+                    dynamic_field_regex, dynamic_field_mapping, raw
+                ))
+                matched_wrappers = match_dynamic_patterns(
+                    dynamic_jira_regex, dynamic_jira_mapping, raw
+                )
+                if matched_wrappers:
+                    dynamic_wrapper = matched_wrappers[-1]
             #
-            else:
-                log.warning("Unsupported finding type")
-                continue # raise ValueError("Unsupported item type")
-        # Cut description if length above configured limit
-        if self.config.get("max_description_size", False):
-            for finding in findings:
-                if len(finding["description"]) > int(self.config.get("max_description_size")):
-                    if "comments" not in finding:
-                        finding["comments"] = list()
-                    #
-                    comment_chunks = list()
-                    cut_line_len = len(constants.JIRA_DESCRIPTION_CUT)
-                    cut_point = int(self.config.get("max_description_size")) - cut_line_len
-                    #
-                    item_description = finding["description"]
-                    finding["description"] = \
-                        f"{item_description[:cut_point]}{constants.JIRA_DESCRIPTION_CUT}"
-                    #
-                    description_data = item_description[cut_point:]
-                    comment_cut_threshold = min(
-                        constants.JIRA_COMMENT_MAX_SIZE,
-                        int(self.config.get("max_description_size"))
-                    )
-                    cut_point = comment_cut_threshold - cut_line_len
-                    #
-                    while description_data:
-                        if len(description_data) > comment_cut_threshold:
-                            comment_chunks.append(
-                                f"{description_data[:cut_point]}{constants.JIRA_DESCRIPTION_CUT}"
-                            )
-                            description_data = description_data[cut_point:]
-                        else:
-                            comment_chunks.append(description_data)
-                            break
-                    #
-                    while comment_chunks:
-                        finding["comments"].insert(0, comment_chunks.pop())
+            severity = item.get_meta("severity", SEVERITIES[-1])
+            priority = constants.JIRA_SEVERITY_MAPPING[severity]
+            if dynamic_wrapper["priority_mapping"] and \
+                    priority in dynamic_wrapper["priority_mapping"]:
+                priority = dynamic_wrapper["priority_mapping"][priority]
+            dynamic_wrapper["mapping_meta"][severity] = priority  # Reflect actual results
+            #
+            findings.append(self._build_finding(
+                item, severity, priority, dynamic_labels, dynamic_fields, dynamic_wrapper
+            ))
         # Sort findings by severity-tool-title
-        findings.sort(key=lambda item: (
-            SEVERITIES.index(item["raw"].get_meta("severity", SEVERITIES[-1])),
-            item["raw"].get_meta("tool", ""),
-            item["raw"].title
-        ))
-        # Submit issues
-        wrapper.connect()
+        findings.sort(key=operator.attrgetter("sort_key"))
+        return findings
+
+    def _apply_size_limits(self, findings):
+        """ Cut descriptions if length above configured limit """
+        for finding in findings:
+            max_size = finding.wrapper["max_description_size"]
+            if max_size and len(finding.description) > max_size:
+                self._cut_description(finding, max_size)
+
+    def _submit(self, findings, wrappers):
+        """ Connect wrappers and submit findings, save resulting tickets to meta """
+        for wrapper in wrappers.values():
+            wrapper["wrapper"].connect()
+            # Config values used for every ticket are prepared once per wrapper
+            wrapper["config_labels"] = self._get_config_labels(wrapper["config"])
+            wrapper["url"] = wrapper["config"].get("url")
+        #
+        new_tickets, existing_tickets = self._submit_findings(findings)
+        self.set_meta("new_tickets", new_tickets)
+        self.set_meta("existing_tickets", existing_tickets)
+
+    def _build_finding(  # pylint: disable=R0913
+            self, item, severity, priority, dynamic_labels, dynamic_fields, wrapper
+    ):
+        """ Make Jira ticket data from finding """
+        tool = item.get_meta("tool", None)
+        issue_hash = item.get_meta("issue_hash", "<no_hash>")
+        sort_key = (  # severity-tool-title
+            _SEVERITY_RANK.get(severity, len(SEVERITIES)),
+            tool if tool is not None else "",
+            item.title
+        )
+        if isinstance(item, DastFinding):
+            return FindingRecord(
+                title=item.title,
+                priority=priority,
+                description=item.description.replace("\\.", "."),
+                issue_hash=issue_hash,
+                additional_labels=list(_sanitize_labels(
+                    tool if tool is not None else "scanner",
+                    self.context.get_meta("testing_type", "DAST"),
+                    severity
+                )) + dynamic_labels,
+                dynamic_fields=dynamic_fields,
+                raw=item,
+                wrapper=wrapper,
+                sort_key=sort_key,
+            )
+        #
+        description_chunks = [html_to_jira(chunk) for chunk in item.description]
+        #
+        # Length of "\n\n".join(description_chunks) without building the string
+        description_size = sum(len(chunk) for chunk in description_chunks) + \
+            2 * (len(description_chunks) - 1)
+        if description_size > constants.JIRA_DESCRIPTION_MAX_SIZE:
+            description = description_chunks[0]
+            chunks = description_chunks[1:]
+            comments = list()
+            new_line_str = '  \n  \n'
+            comment_parts = list()  # Parts of the last comment, joined when it is complete
+            comment_size = 0
+            for chunk in chunks:
+                chunk_data = cut_jira_comment(chunk)
+                if not comment_parts or (comment_size + len(new_line_str) + len(chunk)) >= \
+                        constants.JIRA_COMMENT_MAX_SIZE:
+                    if comment_parts:
+                        comments.append("".join(comment_parts))
+                    comment_parts = [chunk_data]
+                    comment_size = len(chunk_data)
+                else:  # Last comment can handle one more chunk
+                    comment_parts.append(new_line_str)
+                    comment_parts.append(chunk_data)
+                    comment_size += len(new_line_str) + len(chunk_data)
+            if comment_parts:
+                comments.append("".join(comment_parts))
+        else:
+            description = "\n\n".join(description_chunks)
+            comments = list()
+        #
+        return FindingRecord(
+            title=item.title,
+            priority=priority,
+            description=description,
+            issue_hash=issue_hash,
+            additional_labels=list(_sanitize_labels(
+                tool if tool is not None else "scanner",
+                self.context.get_meta("testing_type", "SAST"),
+                severity
+            )) + dynamic_labels,
+            dynamic_fields=dynamic_fields,
+            raw=item,
+            wrapper=wrapper,
+            sort_key=sort_key,
+            comments=comments,
+        )
+
+    def _submit_findings(self, findings):
+        """ Create Jira tickets for findings, returns new and existing tickets """
+        results = [None] * len(findings)
+        #
+        def _submit_group(group):
+            for idx, finding in group:
+                try:
+                    results[idx] = self._submit_finding(finding)
+                except:  # pylint: disable=W0702
+                    log.exception(f"Failed to create ticket for {finding.title}")
+                    results[idx] = Error(
+                        tool=self.get_name(),
+                        error=f"Failed to create ticket for {finding.title}",
+                        details=f"```\n{traceback.format_exc()}\n```"
+                    )
+        #
+        concurrency = int(self.config.get("jira_concurrency", constants.JIRA_CONCURRENCY))
+        if concurrency > 1:
+            # Findings with the same issue hash are submitted sequentially (in one task),
+            # so get_or_create can find ticket created for a previous finding
+            groups = dict()
+            for idx, finding in enumerate(findings):
+                key = (id(finding.wrapper), finding.issue_hash)
+                groups.setdefault(key, list()).append((idx, finding))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(_submit_group, groups.values()))
+        else:
+            _submit_group(enumerate(findings))
+        #
         new_tickets = list()
         existing_tickets = list()
-        for finding in findings:
+        existing_ticket_ids = set()
+        for result in results:
+            if isinstance(result, Error):
+                self.errors.append(result)
+                continue
+            ticket_meta, created = result
+            if created:
+                # Every created ticket is new, several findings can only match existing ones
+                new_tickets.append(ticket_meta)
+            else:
+                if ticket_meta["status"] in constants.JIRA_OPENED_STATUSES:
+                    if ticket_meta["jira_id"] not in existing_ticket_ids:
+                        existing_ticket_ids.add(ticket_meta["jira_id"])
+                        existing_tickets.append(ticket_meta)
+        return new_tickets, existing_tickets
+
+    @staticmethod
+    def _submit_finding(finding):
+        """ Create (or find existing) Jira ticket for finding """
+        wrapper = finding.wrapper
+        config = wrapper["config"]
+        labels = finding.additional_labels + wrapper["config_labels"]
+        #
+        field_overrides = dict()
+        for dynamic_field in finding.dynamic_fields:
+            field_overrides.update(dynamic_field)
+        #
+        issue, created = wrapper["wrapper"].create_issue(
+            finding.title, # title
+            finding.priority, # priority
+            finding.description, # description
+            finding.issue_hash, # issue_hash, self.get_hash_code()
+            # attachments=None,
+            # get_or_create=True,
+            additional_labels=labels, # additional_labels
+            field_overrides=field_overrides,
+        )
+        if created and finding.comments:
+            wrapper["wrapper"].add_comments_to_issue(issue, finding.comments)
+        if created and config.get("separate_epic_linkage", False):
             try:
-                #
-                config_labels = self.config.get("additional_labels", None)
-                if config_labels is None:
-                    config_labels = list()
-                if not isinstance(config_labels, list):
-                    config_labels = [item.strip() for item in config_labels.split(",")]
-                #
-                field_overrides = dict()
-                for dynamic_field in finding["dynamic_fields"]:
-                    field_overrides.update(dynamic_field)
-                #
-                issue, created = wrapper.create_issue(
-                    finding["title"], # title
-                    finding["priority"], # priority
-                    finding["description"], # description
-                    finding["issue_hash"], # issue_hash, self.get_hash_code()
-                    # attachments=None,
-                    # get_or_create=True,
-                    additional_labels=finding["additional_labels"]+config_labels, # additional_labels  # pylint: disable=C0301
-                    field_overrides=field_overrides,
+                wrapper["wrapper"].client.add_issues_to_epic(
+                    wrapper["epic_link"], [str(issue.key)]
                 )
-                if created and "comments" in finding:
-                    for comment in finding["comments"]:
-                        wrapper.add_comment_to_issue(issue, comment)
-                if created and self.config.get("separate_epic_linkage", False):
-                    try:
-                        wrapper.client.add_issues_to_epic(epic_link, [str(issue.key)])
-                    except:  # pylint: disable=W0702
-                        log.exception(
-                            "Failed to add ticket %s to epic %s", str(issue.key), epic_link
-                        )
-                try:
-                    result_priority = str(issue.fields.priority)
-                except:  # pylint: disable=W0702
-                    result_priority = "Default"
-                #
-                ticket_meta = {
-                    "jira_id": issue.key,
-                    "jira_url": f"{self.config.get('url')}/browse/{issue.key}",  # pylint: disable=C0301
-                    "priority": result_priority,
-                    "status": issue.fields.status.name,
-                    "created": issue.fields.created,
-                    "open_date": datetime.strptime(
-                        issue.fields.created, "%Y-%m-%dT%H:%M:%S.%f%z").strftime("%d %b %Y %H:%M"),
-                    "description": issue.fields.summary,
-                    "assignee": str(issue.fields.assignee),
-                    "raw_created": str(issue.fields.created),
-                    "raw_severity": finding["raw"].get_meta("severity", SEVERITIES[-1]),
-                    "raw_jira_url": self.config.get("url"),
-                    "raw_jira_project": self.config.get("project"),
-                    "raw_jira_epic": raw_epic_link,
-                    "raw_jira_fields": self.config.get("fields"),
-                    "raw_addon_fields": field_overrides,
-                    "raw_addon_labels": finding["additional_labels"]+config_labels,
-                }
-                if created:
-                    if not self._ticket_in_list(ticket_meta, new_tickets):
-                        new_tickets.append(ticket_meta)
-                else:
-                    if issue.fields.status.name in constants.JIRA_OPENED_STATUSES:
-                        if not self._ticket_in_list(ticket_meta, existing_tickets):
-                            existing_tickets.append(ticket_meta)
             except:  # pylint: disable=W0702
-                log.exception(f"Failed to create ticket for {finding['title']}")
-                error = Error(
-                    tool=self.get_name(),
-                    error=f"Failed to create ticket for {finding['title']}",
-                    details=f"```\n{traceback.format_exc()}\n```"
+                log.exception(
+                    "Failed to add ticket %s to epic %s", str(issue.key), wrapper["epic_link"]
                 )
-                self.errors.append(error)
-        self.set_meta("new_tickets", new_tickets)
-        self.set_meta("existing_tickets", existing_tickets)
-        self.set_meta("mapping", mapping_meta)
+        issue_fields = issue.fields
+        try:
+            result_priority = str(issue_fields.priority)
+        except:  # pylint: disable=W0702
+            result_priority = "Default"
+        # Jira returns creation time as string already
+        issue_created = issue_fields.created
+        #
+        ticket_meta = {
+            "jira_id": issue.key,
+            "jira_url": f"{wrapper['url']}/browse/{issue.key}",
+            "priority": result_priority,
+            "status": issue_fields.status.name,
+            "created": issue_created,
+            "open_date": parse_jira_datetime(
+                issue_created).strftime(constants.JIRA_OPEN_DATE_FORMAT),
+            "description": issue_fields.summary,
+            "assignee": str(issue_fields.assignee),
+            "raw_created": issue_created,
+            "raw_severity": finding.raw.get_meta("severity", SEVERITIES[-1]),
+            "raw_jira_url": wrapper["url"],
+            "raw_jira_project": config.get("project"),
+            "raw_jira_epic": wrapper["raw_epic_link"],
+            "raw_jira_fields": config.get("fields"),
+            "raw_addon_fields": field_overrides,
+            "raw_addon_labels": labels,
+        }
+        return ticket_meta, created
+
+    @staticmethod
+    def _get_config_labels(config):
+        """ Get additional labels from config (list or comma-separated string) """
+        config_labels = config.get("additional_labels", None)
+        if config_labels is None:
+            return list()
+        if not isinstance(config_labels, list):
+            return [item.strip() for item in config_labels.split(",")]
+        return config_labels
+
+    @staticmethod
+    def _get_priority_mapping(config, wrapper):
+        """ Get priority mapping for wrapper config """
+        # Only ask Jira for priorities when custom mapping is not set
+        if "custom_mapping" in config:
+            return config["custom_mapping"]
+        return prepare_jira_mapping(wrapper)
 
     @staticmethod
-    def _ticket_in_list(ticket_meta, tickets_list):
-        for item in tickets_list:
-            if item["jira_id"] == ticket_meta["jira_id"]:
-                return True
-        return False
+    def _get_max_description_size(config):
+        """ Get configured description size limit (None if not set) """
+        if config.get("max_description_size", False):
+            return int(config.get("max_description_size"))
+        return None
+
+    @staticmethod
+    def _cut_description(finding, max_size):
+        """ Move description part above limit to comments """
+        comment_chunks = list()
+        cut_line_len = len(constants.JIRA_DESCRIPTION_CUT)
+        cut_point = max_size - cut_line_len
+        #
+        item_description = finding.description
+        finding.description = \
+            f"{item_description[:cut_point]}{constants.JIRA_DESCRIPTION_CUT}"
+        #
+        # Walk over original description by offset to avoid copying the tail on every cut
+        position = cut_point
+        description_size = len(item_description)
+        comment_cut_threshold = min(constants.JIRA_COMMENT_MAX_SIZE, max_size)
+        cut_point = comment_cut_threshold - cut_line_len
+        #
+        while position < description_size:
+            if description_size - position > comment_cut_threshold:
+                comment_chunks.append(
+                    f"{item_description[position:position + cut_point]}"
+                    f"{constants.JIRA_DESCRIPTION_CUT}"
+                )
+                position += cut_point
+            else:
+                comment_chunks.append(item_description[position:])
+                break
+        #
+        finding.comments[0:0] = comment_chunks
+
+    @staticmethod
+    def _compile_dynamic_patterns(mapping, name):
+        """ Compile dynamic mapping into list of (pattern, value) """
+        result = list()
+        if mapping:
+            try:
+                for key, value in mapping.items():
+                    result.append((re.compile(key), value))
+            except:  # pylint: disable=W0702
+                log.exception("Failed to add dynamic %s mapping", name)
+        return result
 
     @staticmethod
     def fill_config(data_obj):
@@ -686,22 +564,8 @@ class Reporter(DependentModuleModel, ReporterModel):
             len(data_obj), "fields", CommentedMap(), comment="Fields for created tickets"
         )
         fields_obj = data_obj["fields"]
-        fields_obj.insert(
-            len(fields_obj),
-            "Issue Type", "Bug", comment="(field) Ticket type"
-        )
-        fields_obj.insert(
-            len(fields_obj),
-            "Assignee", "Ticket_Assignee", comment="(field) Assignee"
-        )
-        fields_obj.insert(
-            len(fields_obj),
-            "Epic Link", "SOMEPROJECT-1234", comment="(field) Epic"
-        )
-        fields_obj.insert(
-            len(fields_obj),
-            "Security Level", "SOME_LEVEL", comment="(field) Security level"
-        )
+        for key, value, comment in _SAMPLE_FIELDS:
+            fields_obj.insert(len(fields_obj), key, value, comment=comment)
         fields_obj.insert(
             len(fields_obj),
             "Components/s", CommentedSeq(), comment="(field) Component/s"
@@ -714,26 +578,8 @@ class Reporter(DependentModuleModel, ReporterModel):
             len(data_obj), "custom_mapping", CommentedMap(), comment="Custom priority mapping"
         )
         mapping_obj = data_obj["custom_mapping"]
-        mapping_obj.insert(
-            len(mapping_obj),
-            "Critical", "Very High"
-        )
-        mapping_obj.insert(
-            len(mapping_obj),
-            "Major", "High"
-        )
-        mapping_obj.insert(
-            len(mapping_obj),
-            "Medium", "Medium"
-        )
-        mapping_obj.insert(
-            len(mapping_obj),
-            "Minor", "Low"
-        )
-        mapping_obj.insert(
-            len(mapping_obj),
-            "Trivial", "Low"
-        )
+        for key, value in _SAMPLE_PRIORITY_MAPPING:
+            mapping_obj.insert(len(mapping_obj), key, value)
         data_obj.insert(
             len(data_obj), "separate_epic_linkage", False,
             comment="(optional) Link to Epics after ticket creation"
@@ -742,6 +588,10 @@ class Reporter(DependentModuleModel, ReporterModel):
             len(data_obj), "max_description_size", constants.JIRA_DESCRIPTION_MAX_SIZE,
             comment="(optional) Cut description longer than set limit"
         )
+        data_obj.insert(
+            len(data_obj), "jira_concurrency", constants.JIRA_CONCURRENCY,
+            comment="(optional) Number of tickets submitted in parallel (1 - sequential)"
+        )
 
     @staticmethod
     def validate_config(config):
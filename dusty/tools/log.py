@@ -78,12 +78,15 @@ def get_outer_logger():
 
 def log_subprocess_result(task):
     """ Log subprocess args, returncode, stdout and stderr """
-    get_outer_logger().debug("Subprocess args: %s", task.args)
-    get_outer_logger().debug("Subprocess returncode: %d", task.returncode)
+    logger = get_outer_logger()
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Subprocess args: %s", task.args)
+    logger.debug("Subprocess returncode: %d", task.returncode)
     if task.stdout is not None:
-        get_outer_logger().debug("Subprocess stdout: %s", task.stdout)
+        logger.debug("Subprocess stdout: %s", task.stdout)
     if task.stderr is not None:
-        get_outer_logger().debug("Subprocess stderr: %s", task.stderr)
+        logger.debug("Subprocess stderr: %s", task.stderr)
 
 
 def debug(msg, *args, **kwargs):
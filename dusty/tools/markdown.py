@@ -21,6 +21,7 @@
 """
 
 import re
+import functools
 import traceback
 import markdown2
 import inscriptis
@@ -29,15 +30,33 @@ from bs4 import BeautifulSoup
 from dusty.tools import log
 
 
+_PRE_CODE_TITLE_RE = re.compile(r'{code:title=(?P<title>.*?)\|(?P<style>.*?)}')
+_PRE_TABLE_PANEL_RE = re.compile(r'\n\n(?P<data>\|\|(.*?[\n]*?)+\|)\n\n', re.MULTILINE)
+_PRE_TABLE_ITEM_RE = re.compile(r'\|\| \*(?P<name>.*?)\* \| (?P<value>.*?) \|')
+_POST_PANEL_TITLE_RE = re.compile(
+    r'(\<p\>)?\s*{panel:title=(?P<title>.*?):(?P<style>.*?)}\s*(\<\/p\>)?'
+)
+_POST_PANEL_END_RE = re.compile(r'(\<p\>)?\s*{panel}\s*(\<\/p\>)?')
+_POST_CODE_TITLE_RE = re.compile(
+    r'(\<p\>)?\s*{code:title=(?P<title>.*?)\|(?P<style>.*?)}\s*(\<\/p\>)?'
+)
+_POST_CODE_END_RE = re.compile(r'(\<p\>)?\s*{code}\s*(\<\/p\>)?')
+
+# Number of rendered texts kept by cached_markdown_to_html (repeated boilerplate only)
+_HTML_CACHE_SIZE = 1024
+
+
 def markdown_to_html(text):
     """ Convert markdown to HTML """
-    # Install markdown2 hooks to support "{panel}", "{code}" and "|| tables |"
-    markdown2.Markdown.preprocess = _markdown2_preprocess
-    markdown2.Markdown.postprocess = _markdown2_postprocess
-    # Run markdown2
     return markdown2.markdown(text, extras=["tables", "wiki-tables", "fenced-code-blocks"])
 
 
+@functools.lru_cache(maxsize=_HTML_CACHE_SIZE)
+def cached_markdown_to_html(text):
+    """ Convert markdown to HTML, reusing results for repeated texts """
+    return markdown_to_html(text)
+
+
 def _markdown2_preprocess(self, text):  # pylint: disable=W0613
     # Handle {code}
     def _code_handler(item):
@@ -46,11 +65,7 @@ def _markdown2_preprocess(self, text):  # pylint: disable=W0613
             item.group("title") + \
             "|" + item.group("style") + \
             "}\n```\n"
-    text = re.sub(
-        r'{code:title=(?P<title>.*?)\|(?P<style>.*?)}',
-        _code_handler,
-        text
-    )
+    text = _PRE_CODE_TITLE_RE.sub(_code_handler, text)
     text = text.replace("{code}", "```\n{code}")
     # Handle || tables |
     def _table_panel_handler(item):
@@ -58,20 +73,11 @@ def _markdown2_preprocess(self, text):  # pylint: disable=W0613
             "\n\n{panel:title=Instance:}\n" \
             f'{item.group("data")}\n' \
             "{panel}\n\n"
-    text = re.sub(
-        r'\n\n(?P<data>\|\|(.*?[\n]*?)+\|)\n\n',
-        _table_panel_handler,
-        text,
-        flags=re.MULTILINE
-    )
+    text = _PRE_TABLE_PANEL_RE.sub(_table_panel_handler, text)
     def _table_item_handler(item):
         return \
             f'**{item.group("name")}**: {item.group("value")}'
-    text = re.sub(
-        r'\|\| \*(?P<name>.*?)\* \| (?P<value>.*?) \|',
-        _table_item_handler,
-        text
-    )
+    text = _PRE_TABLE_ITEM_RE.sub(_table_item_handler, text)
     return text
 
 
@@ -81,35 +87,24 @@ def _markdown2_postprocess(self, text):  # pylint: disable=W0613
         return \
             f'<div class="card">' \
             f'<div class="card-header">{item.group("title")}</div><div class="card-body">'
-    text = re.sub(
-        r'(\<p\>)?\s*{panel:title=(?P<title>.*?):(?P<style>.*?)}\s*(\<\/p\>)?',
-        _panel_handler,
-        text
-    )
-    text = re.sub(
-        r'(\<p\>)?\s*{panel}\s*(\<\/p\>)?',
-        "</div></div>",
-        text
-    )
+    text = _POST_PANEL_TITLE_RE.sub(_panel_handler, text)
+    text = _POST_PANEL_END_RE.sub("</div></div>", text)
     # Handle {code}
     def _code_handler(item):
         return \
             f'<div class="card">' \
             f'<div class="card-header">{item.group("title")}</div><div class="card-body">'
-    text = re.sub(
-        r'(\<p\>)?\s*{code:title=(?P<title>.*?)\|(?P<style>.*?)}\s*(\<\/p\>)?',
-        _code_handler,
-        text
-    )
-    text = re.sub(
-        r'(\<p\>)?\s*{code}\s*(\<\/p\>)?',
-        "</div></div>",
-        text
-    )
+    text = _POST_CODE_TITLE_RE.sub(_code_handler, text)
+    text = _POST_CODE_END_RE.sub("</div></div>", text)
     # Return result
     return text
 
 
+# Install markdown2 hooks to support "{panel}", "{code}" and "|| tables |"
+markdown2.Markdown.preprocess = _markdown2_preprocess
+markdown2.Markdown.postprocess = _markdown2_postprocess
+
+
 def markdown_escape(string):
     """ Escape markdown special symbols """
     to_escape = [
@@ -23,15 +23,18 @@ import re
 
 from collections import namedtuple
 
+_URL_PATTERN = re.compile("".join([
+    r"^\s*((?P<protocol>.*?)\:\/\/)?",
+    r"((?P<username>.*?)(\:(?P<password>.*))?\@)?",
+    r"((?P<hostname>.*?)(\:((?P<port>[0-9]+)))?)(?P<path>/.*?)?",
+    r"(?P<query>\?.*?)?(?P<fragment>\#.*?)?\s*$"
+]))
+_IP_PATTERN = re.compile(r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\s")
+
 
 def parse_url(url):
     """ Parses URL into parts """
-    parsed_url = re.search("".join([
-        r"^\s*((?P<protocol>.*?)\:\/\/)?",
-        r"((?P<username>.*?)(\:(?P<password>.*))?\@)?",
-        r"((?P<hostname>.*?)(\:((?P<port>[0-9]+)))?)(?P<path>/.*?)?",
-        r"(?P<query>\?.*?)?(?P<fragment>\#.*?)?\s*$"
-    ]), url)
+    parsed_url = _URL_PATTERN.search(url)
     protocol = parsed_url.group("protocol")
     hostname = parsed_url.group("hostname")
     port = parsed_url.group("port")
@@ -70,6 +73,4 @@ def get_port(parsed_url):
 
 def find_ip(url):
     """ Find IP address in string (code from dusty 1.0) """
-    ip_pattern = re.compile('\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\s')  # pylint: disable=W1401
-    ip_value = re.findall(ip_pattern, url)
-    return ip_value
+    return _IP_PATTERN.findall(url)